@@ -6,18 +6,33 @@ Implements proper MCP HTTP/SSE protocol for LM Studio compatibility
 """
 
 import asyncio
+import atexit
 import json
 import logging
+import multiprocessing
+import os
+import queue
 import re
+import signal
+import sys
+import time
 import unicodedata
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 
-import requests
+import aiohttp
+from aiohttp_socks import ProxyConnector
+from async_lru import alru_cache
+import orjson
 from bs4 import BeautifulSoup
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 import uvicorn
 
@@ -28,13 +43,106 @@ DEFAULT_MAX_WORDS = 5000
 REQUEST_TIMEOUT = 20
 SERVER_PORT = 8765
 USE_TOR = False  # Set to True to route scraping requests through Tor (requires Tor running on 127.0.0.1:9050)
+HTTP_POOL_LIMIT = 100  # Max open connections across all hosts
+HTTP_POOL_LIMIT_PER_HOST = 10  # Max open connections to a single host
+HTTP_KEEPALIVE_TIMEOUT = 30  # Seconds to keep idle connections open for reuse
+DNS_CACHE_TTL = 900  # Seconds to cache resolved hostnames
+SCRAPE_CACHE_SIZE = 512  # Max scraped pages kept in memory
+SCRAPE_CACHE_TTL = 600  # Seconds before a cached page is fetched again
+MAX_PAGE_BYTES = 2 * 1024 * 1024  # Stop downloading a page after this many bytes
+SCRAPE_CHUNK_SIZE = 16384  # Bytes read per chunk while streaming a page
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")  # Content types worth scraping
+MAX_CONCURRENT_SCRAPES = 20  # Max pages downloaded at once across all hosts
+MAX_CONCURRENT_SCRAPES_PER_HOST = 3  # Max pages downloaded at once from a single host
+URL_BATCH_WINDOW = 0.005  # Seconds to collect get_website URLs into one batch
+CIRCUIT_BREAKER_THRESHOLD = 2  # Consecutive connection failures before a host is skipped
+CIRCUIT_BREAKER_COOLDOWN = 60  # Seconds to skip a failing host (and to remember a failure)
+SSE_KEEPALIVE_INTERVAL = 15  # Seconds between SSE keepalive pings
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Precompiled text cleanup patterns
+WHITESPACE_RE = re.compile(r"\s+")
+WORD_RE = re.compile(r"\S+")
+
+@lru_cache(maxsize=None)
+def emoji_translation_table() -> Dict[int, None]:
+    """Build (once) a str.translate table that deletes all 'So' (other symbol) characters"""
+    return {
+        codepoint: None
+        for codepoint in range(sys.maxunicode + 1)
+        if unicodedata.category(chr(codepoint)) == "So"
+    }
+
+# Text processing - module-level so it can run in the parse process pool
+def remove_emojis(text: str) -> str:
+    """Remove emojis from text"""
+    return text.translate(emoji_translation_table())
+
+def clean_text(text: str) -> str:
+    """Normalize and tidy text already extracted from HTML"""
+    formatted_text = unicodedata.normalize("NFKC", text)
+    formatted_text = remove_emojis(formatted_text)
+    formatted_text = WHITESPACE_RE.sub(" ", formatted_text)
+    return formatted_text.strip()
+
+def truncate_to_words(text: str, word_limit: int) -> Tuple[str, int]:
+    """Truncate text to specified word count, returning the text and its word count"""
+    if word_limit <= 0:
+        return "", 0
+    # Scan words lazily and cut at the end of the last one kept
+    count = 0
+    for count, match in enumerate(WORD_RE.finditer(text), 1):
+        if count == word_limit:
+            return text[:match.end()], count
+    return text, count
+
+def parse_html(html: bytes, encoding: Optional[str], max_words: int) -> Tuple[str, str, int]:
+    """Extract (title, truncated text, word count) from a raw HTML page"""
+    soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
+    
+    title = ""
+    if soup.title and soup.title.string:
+        title = soup.title.string.strip()
+    
+    content, word_count = truncate_to_words(clean_text(soup.get_text(separator=" ", strip=True)), max_words)
+    return title, content, word_count
+
+def new_parse_pool() -> ProcessPoolExecutor:
+    """Create the HTML parse process pool"""
+    # Never fork workers from the running server: they would inherit its open sockets
+    # (listener, client and upstream connections) and its threads. Start them from a
+    # clean forkserver instead (spawn on Windows, which has no forkserver).
+    start_method = "spawn" if sys.platform == "win32" else "forkserver"
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context(start_method),
+        # Leave Ctrl+C to the server, which shuts the pool down on exit
+        initializer=signal.signal,
+        initargs=(signal.SIGINT, signal.SIG_IGN)
+    )
+
+# Setup logging - handlers only enqueue records; a listener thread does the writing
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger("searxng-mcp")
 
 # FastAPI app
-app = FastAPI(title="SearXNG MCP Server", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources on startup and release them on shutdown"""
+    await web_tools.start()
+    try:
+        yield
+    finally:
+        await web_tools.close()
+
+app = FastAPI(
+    title="SearXNG MCP Server",
+    version="1.0.0",
+    lifespan=lifespan
+)
 
 # Add CORS middleware
 app.add_middleware(
@@ -58,6 +166,53 @@ class MCPResponse(BaseModel):
     result: Optional[Any] = None
     error: Optional[Dict[str, Any]] = None
 
+class ScrapeError(Exception):
+    """Raised when a fetched page cannot be scraped"""
+
+class URLBatcher:
+    """Coalesce URL fetches requested within a short window into one concurrent batch"""
+
+    def __init__(self, fetch: Callable[[str], Awaitable[Any]], window: float = URL_BATCH_WINDOW):
+        self.fetch_url = fetch
+        self.window = window
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.batch_tasks: Set[asyncio.Task] = set()
+    
+    async def fetch(self, url: str) -> Any:
+        """Queue a URL for the next batch and wait for its result"""
+        future = self.pending.get(url)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self.pending[url] = future
+            if self.flush_handle is None:
+                self.flush_handle = loop.call_later(self.window, self._flush)
+        # Shield so one cancelled caller doesn't cancel the result shared with others
+        return await asyncio.shield(future)
+    
+    def _flush(self):
+        """Start fetching every pending URL as one batch"""
+        self.flush_handle = None
+        batch, self.pending = self.pending, {}
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self.batch_tasks.add(task)
+        task.add_done_callback(self.batch_tasks.discard)
+    
+    async def _run_batch(self, batch: Dict[str, asyncio.Future]):
+        """Fetch a batch of URLs concurrently and resolve their futures"""
+        results = await asyncio.gather(
+            *[self.fetch_url(url) for url in batch],
+            return_exceptions=True
+        )
+        for future, result in zip(batch.values(), results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
 class WebSearchTools:
     """Web search and scraping utilities"""
 
@@ -66,37 +221,73 @@ class WebSearchTools:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
         }
         # Configure Tor proxy if enabled
-        self.proxies = None
+        self.proxy_url = None
         if USE_TOR:
-            self.proxies = {
-                'http': 'socks5://127.0.0.1:9050',
-                'https': 'socks5://127.0.0.1:9050'
-            }
+            self.proxy_url = "socks5://127.0.0.1:9050"
             logger.info("Tor proxy enabled for scraping requests")
+        # Shared HTTP session, opened on app startup
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Async DNS resolver for the direct (non-Tor) connector
+        self.resolver: Optional[aiohttp.AsyncResolver] = None
+        # Process pool for CPU-bound HTML parsing, started on app startup
+        self.parse_pool: Optional[ProcessPoolExecutor] = None
+        # Limit scrape fan-out globally and per host, created on app startup
+        self.scrape_slots: Optional[asyncio.Semaphore] = None
+        # host -> (semaphore, scrapes holding or waiting on it)
+        self.host_scrape_slots: Dict[str, Tuple[asyncio.Semaphore, int]] = {}
+        # Per-host circuit breaker: host -> (consecutive failures, expires at)
+        self.host_failures: Dict[str, Tuple[int, float]] = {}
+        # Coalesce get_website calls arriving close together
+        self.url_batcher = URLBatcher(self.scrape_url)
     
-    def remove_emojis(self, text: str) -> str:
-        """Remove emojis from text"""
-        return "".join(c for c in text if not unicodedata.category(c).startswith("So"))
-    
-    def format_text(self, text: str) -> str:
-        """Clean and format scraped text"""
-        soup = BeautifulSoup(text, "html.parser")
-        formatted_text = soup.get_text(separator=" ", strip=True)
-        formatted_text = unicodedata.normalize("NFKC", formatted_text)
-        formatted_text = re.sub(r"\s+", " ", formatted_text)
-        formatted_text = formatted_text.strip()
-        return self.remove_emojis(formatted_text)
+    async def start(self):
+        """Open the shared HTTP session (pooled keep-alive connections) and parse pool"""
+        self.parse_pool = new_parse_pool()
+        # Semaphores bind to the current loop on Python 3.9, so create them on the running one
+        self.scrape_slots = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+        self.host_scrape_slots = {}
+        # Build the emoji table off the event loop so the first request doesn't stall on it
+        await asyncio.to_thread(emoji_translation_table)
+        
+        connector_options = {
+            "limit": HTTP_POOL_LIMIT,
+            "limit_per_host": HTTP_POOL_LIMIT_PER_HOST,
+            "keepalive_timeout": HTTP_KEEPALIVE_TIMEOUT
+        }
+        if self.proxy_url:
+            # Tor resolves hostnames itself, so there is no local DNS to cache
+            connector = ProxyConnector.from_url(self.proxy_url, **connector_options)
+        else:
+            self.resolver = aiohttp.AsyncResolver()
+            connector = aiohttp.TCPConnector(
+                resolver=self.resolver,
+                use_dns_cache=True,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                **connector_options
+            )
+        
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        )
     
-    def truncate_to_words(self, text: str, word_limit: int) -> str:
-        """Truncate text to specified word count"""
-        words = text.split()
-        if len(words) <= word_limit:
-            return text
-        return " ".join(words[:word_limit])
+    async def close(self):
+        """Close the shared HTTP session, DNS resolver and parse pool"""
+        if self.session:
+            await self.session.close()
+            self.session = None
+        if self.resolver:
+            # The connector doesn't own a resolver it was given, so close it here
+            await self.resolver.close()
+            self.resolver = None
+        if self.parse_pool:
+            self.parse_pool.shutdown(wait=False, cancel_futures=True)
+            self.parse_pool = None
     
     async def search_web(self, query: str, max_results: int = DEFAULT_MAX_RESULTS) -> List[Dict[str, Any]]:
         """Search SearXNG and scrape the resulting pages"""
-        logger.info(f"Searching for: {query}")
+        logger.info("Searching for: %s", query)
         
         params = {
             "q": query,
@@ -105,69 +296,138 @@ class WebSearchTools:
         }
         
         try:
-            response = requests.get(
-                SEARXNG_BASE_URL,
-                params=params,
-                headers=self.headers,
-                proxies=self.proxies,
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            search_data = response.json()
+            async with self.session.get(SEARXNG_BASE_URL, params=params) as response:
+                response.raise_for_status()
+                search_data = orjson.loads(await response.read())
             
             results = search_data.get("results", [])
             limited_results = results[:max_results]
             
-            logger.info(f"Found {len(limited_results)} search results")
+            logger.info("Found %d search results", len(limited_results))
+            
+            # Scrape all result pages concurrently
+            scraped = await asyncio.gather(
+                *[
+                    self.scrape_url(
+                        result["url"],
+                        title=result.get("title", ""),
+                        snippet=result.get("content", "")
+                    )
+                    for result in limited_results
+                ],
+                return_exceptions=True
+            )
             
             scraped_results = []
-            for result in limited_results:
-                scraped_result = await self.scrape_url(
-                    result["url"],
-                    title=result.get("title", ""),
-                    snippet=result.get("content", "")
-                )
-                if scraped_result:
+            for result, scraped_result in zip(limited_results, scraped):
+                if isinstance(scraped_result, Exception):
+                    logger.error("Failed to scrape %s: %s", result["url"], scraped_result)
+                elif scraped_result:
                     scraped_results.append(scraped_result)
             
-            logger.info(f"Successfully scraped {len(scraped_results)} pages")
+            logger.info("Successfully scraped %d pages", len(scraped_results))
             return scraped_results
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Search failed: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            logger.error("Search failed: %s", e)
             return [{"error": f"Search failed: {str(e)}"}]
     
-    async def scrape_url(self, url: str, title: str = "", snippet: str = "") -> Optional[Dict[str, Any]]:
-        """Scrape content from a specific URL"""
+    @asynccontextmanager
+    async def _host_slot(self, host: str):
+        """Hold one of a host's scrape slots, dropping its semaphore once no scrape uses it"""
+        slots, users = self.host_scrape_slots.get(host, (None, 0))
+        if slots is None:
+            slots = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES_PER_HOST)
+        self.host_scrape_slots[host] = (slots, users + 1)
         try:
-            response = requests.get(url, headers=self.headers, proxies=self.proxies, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            if not title and soup.title:
-                title = soup.title.string.strip()
+            async with slots:
+                yield
+        finally:
+            slots, users = self.host_scrape_slots[host]
+            if users == 1:
+                del self.host_scrape_slots[host]
+            else:
+                self.host_scrape_slots[host] = (slots, users - 1)
+    
+    @alru_cache(maxsize=SCRAPE_CACHE_SIZE, ttl=SCRAPE_CACHE_TTL)
+    async def _fetch_and_parse(self, url: str) -> Tuple[str, str, int]:
+        """Fetch a URL and return its page title, truncated text and word count (cached by URL)"""
+        host = urlparse(url).netloc
+        
+        # Take the per-host slot first so a busy host doesn't hold global slots
+        async with self._host_slot(host), self.scrape_slots:
+            # Fail fast on hosts that keep refusing connections or timing out
+            failures, expires = self.host_failures.get(host, (0, 0.0))
+            if failures and time.monotonic() >= expires:
+                del self.host_failures[host]
+            elif failures >= CIRCUIT_BREAKER_THRESHOLD:
+                raise ScrapeError(f"Skipping {host} after repeated connection failures")
             
-            content = self.format_text(soup.get_text(separator=" ", strip=True))
-            truncated_content = self.truncate_to_words(content, DEFAULT_MAX_WORDS)
+            try:
+                async with self.session.get(url) as response:
+                    response.raise_for_status()
+                    
+                    content_type = response.headers.get("Content-Type", "").lower()
+                    if not content_type.startswith(HTML_CONTENT_TYPES):
+                        raise ScrapeError(f"Unsupported content type: {content_type or 'unknown'}")
+                    
+                    # Stream the body and stop once the size cap is reached
+                    html = bytearray()
+                    async for chunk in response.content.iter_chunked(SCRAPE_CHUNK_SIZE):
+                        html.extend(chunk)
+                        if len(html) >= MAX_PAGE_BYTES:
+                            response.close()
+                            break
+                    # Trim in place rather than slicing, which would copy the page
+                    del html[MAX_PAGE_BYTES:]
+                    encoding = response.charset
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                now = time.monotonic()
+                # Sweep expired entries so hosts that are never retried don't linger
+                for expired_host in [h for h, (_, e) in self.host_failures.items() if now >= e]:
+                    del self.host_failures[expired_host]
+                failures = self.host_failures.get(host, (0, 0.0))[0] + 1
+                self.host_failures[host] = (failures, now + CIRCUIT_BREAKER_COOLDOWN)
+                raise
             
-            return {
-                "title": self.remove_emojis(title or "No title"),
-                "url": url,
-                "content": truncated_content,
-                "snippet": self.remove_emojis(snippet or ""),
-                "word_count": len(truncated_content.split())
-            }
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to scrape {url}: {str(e)}")
+            self.host_failures.pop(host, None)
+        
+        # Parse in a worker process so concurrent scrapes aren't serialized by the GIL
+        loop = asyncio.get_running_loop()
+        parse_pool = self.parse_pool
+        try:
+            return await loop.run_in_executor(
+                parse_pool, parse_html, bytes(html), encoding, DEFAULT_MAX_WORDS
+            )
+        except BrokenProcessPool:
+            # A crashed worker breaks the pool for good - replace it (once) so later scrapes recover
+            if self.parse_pool is parse_pool:
+                logger.warning("HTML parse worker crashed, restarting parse pool")
+                self.parse_pool = new_parse_pool()
+                parse_pool.shutdown(wait=False)
+            raise ScrapeError("HTML parse worker crashed")
+    
+    async def scrape_url(self, url: str, title: str = "", snippet: str = "") -> Optional[Dict[str, Any]]:
+        """Scrape content from a specific URL"""
+        try:
+            page_title, content, word_count = await self._fetch_and_parse(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ScrapeError, ValueError) as e:
+            logger.error("Failed to scrape %s: %s", url, e)
             return None
+        
+        return {
+            "title": remove_emojis(title or page_title or "No title"),
+            "url": url,
+            "content": content,
+            "snippet": remove_emojis(snippet or ""),
+            "word_count": word_count
+        }
     
     async def get_website(self, url: str) -> Dict[str, Any]:
         """Scrape a specific website URL"""
-        logger.info(f"Scraping website: {url}")
+        logger.info("Scraping website: %s", url)
         
-        result = await self.scrape_url(url)
+        result = await self.url_batcher.fetch(url)
         if result:
             return result
         else:
@@ -180,65 +440,74 @@ class WebSearchTools:
 # Initialize tools
 web_tools = WebSearchTools()
 
+# Static MCP payloads, built once at import
+INITIALIZE_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {}
+    },
+    "serverInfo": {
+        "name": "searxng-search",
+        "version": "1.0.0"
+    }
+}
+
+TOOLS_LIST_RESULT = {
+    "tools": [
+        {
+            "name": "search_web",
+            "description": "Search the web using SearXNG and scrape the resulting pages. Use this for finding current information, news, facts, or any web content.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "The search query to find relevant web content"
+                    },
+                    "max_results": {
+                        "type": "integer",
+                        "description": "Maximum number of pages to scrape (default: 5)",
+                        "default": DEFAULT_MAX_RESULTS
+                    }
+                },
+                "required": ["query"]
+            }
+        },
+        {
+            "name": "get_website",
+            "description": "Scrape content from a specific website URL. Use this when you have a specific URL you want to extract content from.",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "url": {
+                        "type": "string",
+                        "description": "The URL of the website to scrape"
+                    }
+                },
+                "required": ["url"]
+            }
+        }
+    ]
+}
+
+# Pre-encoded SSE frames
+SSE_INITIALIZED_EVENT = b"data: {\"jsonrpc\":\"2.0\",\"method\":\"initialized\",\"params\":{}}\n\n"
+SSE_PING_EVENT = b"data: {\"type\":\"ping\"}\n\n"
+
 # MCP Protocol Implementation
 async def handle_mcp_method(method: str, params: Optional[Dict[str, Any]], request_id: Optional[Union[str, int]]):
     """Handle MCP protocol methods"""
     
     # Handle notifications (no response needed)
     if method.startswith("notifications/"):
-        logger.info(f"Received notification: {method}")
+        logger.info("Received notification: %s", method)
         return None  # Notifications don't get responses
     
     if method == "initialize":
-        return {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {
-                "tools": {}
-            },
-            "serverInfo": {
-                "name": "searxng-search",
-                "version": "1.0.0"
-            }
-        }
+        return INITIALIZE_RESULT
     
     elif method == "tools/list":
-        return {
-            "tools": [
-                {
-                    "name": "search_web",
-                    "description": "Search the web using SearXNG and scrape the resulting pages. Use this for finding current information, news, facts, or any web content.",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "The search query to find relevant web content"
-                            },
-                            "max_results": {
-                                "type": "integer",
-                                "description": "Maximum number of pages to scrape (default: 5)",
-                                "default": DEFAULT_MAX_RESULTS
-                            }
-                        },
-                        "required": ["query"]
-                    }
-                },
-                {
-                    "name": "get_website",
-                    "description": "Scrape content from a specific website URL. Use this when you have a specific URL you want to extract content from.",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "url": {
-                                "type": "string",
-                                "description": "The URL of the website to scrape"
-                            }
-                        },
-                        "required": ["url"]
-                    }
-                }
-            ]
-        }
+        return TOOLS_LIST_RESULT
     
     elif method == "tools/call":
         if not params:
@@ -318,31 +587,34 @@ async def handle_mcp_method(method: str, params: Optional[Dict[str, Any]], reque
         raise HTTPException(status_code=400, detail=f"Unknown method: {method}")
 
 # HTTP endpoints
+def orjson_response(content: Any, status_code: int = 200) -> Response:
+    """Build a JSON response encoded with orjson (FastAPI's ORJSONResponse is deprecated)"""
+    return Response(content=orjson.dumps(content), status_code=status_code, media_type="application/json")
+
 @app.post("/")
 async def handle_mcp_post(request: Request):
     """Handle MCP HTTP requests"""
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         
         # Handle both single requests and batch requests
         if isinstance(body, list):
-            # Batch request
-            responses = []
-            for req in body:
-                try:
-                    result = await handle_mcp_method(
+            # Batch request - dispatch all calls concurrently
+            results = await asyncio.gather(
+                *[
+                    handle_mcp_method(
                         req.get("method"),
                         req.get("params"),
                         req.get("id")
                     )
-                    # Only add response if it's not a notification (result is not None)
-                    if result is not None:
-                        responses.append({
-                            "jsonrpc": "2.0",
-                            "id": req.get("id"),
-                            "result": result
-                        })
-                except Exception as e:
+                    for req in body
+                ],
+                return_exceptions=True
+            )
+            
+            responses = []
+            for req, result in zip(body, results):
+                if isinstance(result, Exception):
                     # Only add error response if it's not a notification
                     if not req.get("method", "").startswith("notifications/"):
                         responses.append({
@@ -351,10 +623,17 @@ async def handle_mcp_post(request: Request):
                             "error": {
                                 "code": -32603,
                                 "message": "Internal error",
-                                "data": str(e)
+                                "data": str(result)
                             }
                         })
-            return responses
+                # Only add response if it's not a notification (result is not None)
+                elif result is not None:
+                    responses.append({
+                        "jsonrpc": "2.0",
+                        "id": req.get("id"),
+                        "result": result
+                    })
+            return orjson_response(responses)
         else:
             # Single request
             result = await handle_mcp_method(
@@ -364,18 +643,18 @@ async def handle_mcp_post(request: Request):
             )
             # Only return response if it's not a notification
             if result is not None:
-                return {
+                return orjson_response({
                     "jsonrpc": "2.0",
                     "id": body.get("id"),
                     "result": result
-                }
+                })
             else:
                 # For notifications, return empty 200 response
-                return JSONResponse(status_code=200, content={})
+                return orjson_response({})
     
     except Exception as e:
-        logger.error(f"Error handling MCP request: {str(e)}")
-        return JSONResponse(
+        logger.error("Error handling MCP request: %s", e)
+        return orjson_response(
             status_code=500,
             content={
                 "jsonrpc": "2.0",
@@ -407,11 +686,11 @@ async def sse_fallback(request: Request):
         # Return proper SSE response
         async def sse_generator():
             # Send initial connection event
-            yield "data: {\"jsonrpc\":\"2.0\",\"method\":\"initialized\",\"params\":{}}\n\n"
+            yield SSE_INITIALIZED_EVENT
             # Keep connection alive
             while True:
-                await asyncio.sleep(1)
-                yield "data: {\"type\":\"ping\"}\n\n"
+                await asyncio.sleep(SSE_KEEPALIVE_INTERVAL)
+                yield SSE_PING_EVENT
         
         return StreamingResponse(
             sse_generator(),
@@ -437,7 +716,14 @@ async def sse_fallback(request: Request):
 
 if __name__ == "__main__":
     logger.info("Starting SearXNG HTTP MCP Server...")
-    logger.info(f"SearXNG URL: {SEARXNG_BASE_URL}")
-    logger.info(f"Server will run on http://localhost:{SERVER_PORT}")
+    logger.info("SearXNG URL: %s", SEARXNG_BASE_URL)
+    logger.info("Server will run on http://localhost:%d", SERVER_PORT)
     
-    uvicorn.run(app, host="0.0.0.0", port=SERVER_PORT, log_level="info")
\ No newline at end of file
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=SERVER_PORT,
+        log_level="info",
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows support
+        http="httptools"
+    )
\ No newline at end of file